@@ -1,13 +1,15 @@
 from __future__ import absolute_import
 
+import json
+
 from collections import defaultdict
 from sqlalchemy.orm import contains_eager, joinedload, subqueryload_all
 from sqlalchemy.sql import func
 from uuid import UUID
 
-from changes.api.base import APIView
+from changes.api.base import APIView, as_json
 from changes.api.serializer.models.testcase import TestCaseWithOriginSerializer
-from changes.config import db
+from changes.config import db, redis
 from changes.constants import Result, Status, NUM_PREVIOUS_RUNS
 from changes.models import (
     Build, Source, Event, FailureReason, Job, TestCase, BuildSeen, User
@@ -124,7 +126,50 @@ def get_failure_reasons(build):
 
 
 class BuildDetailsAPIView(APIView):
+    # finished builds never change, so their responses can be cached for a
+    # generous window
+    cache_expire = 86400
+
+    def get_cache_key(self, build_id):
+        # a build's details are immutable once it finishes, so key on
+        # (id, date_finished) and let unfinished builds skip the cache
+        date_finished = db.session.query(Build.date_finished).filter(
+            Build.id == build_id,
+            Build.status == Status.finished,
+        ).scalar()
+        if date_finished is None:
+            return None
+        return 'api:build_details:{0}:{1}'.format(
+            build_id, date_finished.isoformat())
+
+    def get_mutable_context(self, build_id):
+        # seenBy and events keep changing after a build finishes (views and
+        # listeners create rows asynchronously), so they are always fetched
+        # fresh and never cached
+        seen_by = list(User.query.join(
+            BuildSeen, BuildSeen.user_id == User.id,
+        ).filter(
+            BuildSeen.build_id == build_id,
+        ))
+
+        event_list = list(Event.query.filter(
+            Event.item_id == build_id,
+        ).order_by(Event.date_created.desc()))
+
+        return {
+            'seenBy': self.serialize(seen_by),
+            'events': self.serialize(event_list),
+        }
+
     def get(self, build_id):
+        cache_key = self.get_cache_key(build_id)
+        if cache_key is not None:
+            cached = redis.get(cache_key)
+            if cached is not None:
+                context = json.loads(cached)
+                context.update(self.get_mutable_context(build_id))
+                return self.respond(context, serialize=False)
+
         build = Build.query.options(
             joinedload('project', innerjoin=True),
             joinedload('author'),
@@ -157,14 +202,18 @@ class BuildDetailsAPIView(APIView):
         ))
 
         # identify failures
-        test_failures = TestCase.query.options(
-            joinedload('job', innerjoin=True),
+        # fetch the window'd total alongside the rows themselves so we only
+        # pay for a single round-trip
+        test_failure_rows = db.session.query(
+            TestCase, func.count().over().label('total'),
+        ).options(
+            joinedload(TestCase.job, innerjoin=True),
         ).filter(
             TestCase.job_id.in_([j.id for j in jobs]),
             TestCase.result == Result.failed,
-        ).order_by(TestCase.name.asc())
-        num_test_failures = test_failures.count()
-        test_failures = test_failures[:25]
+        ).order_by(TestCase.name.asc()).limit(25).all()
+        num_test_failures = test_failure_rows[0][1] if test_failure_rows else 0
+        test_failures = [r[0] for r in test_failure_rows]
 
         failures_by_job = defaultdict(list)
         for failure in test_failures:
@@ -181,26 +230,14 @@ class BuildDetailsAPIView(APIView):
         else:
             changed_tests = []
 
-        seen_by = list(User.query.join(
-            BuildSeen, BuildSeen.user_id == User.id,
-        ).filter(
-            BuildSeen.build_id == build.id,
-        ))
-
         extended_serializers = {
             TestCase: TestCaseWithOriginSerializer(),
         }
 
-        event_list = list(Event.query.filter(
-            Event.item_id == build.id,
-        ).order_by(Event.date_created.desc()))
-
         context = self.serialize(build)
         context.update({
             'jobs': jobs,
             'previousRuns': previous_runs,
-            'seenBy': seen_by,
-            'events': event_list,
             'failures': get_failure_reasons(build),
             'testFailures': {
                 'total': num_test_failures,
@@ -209,7 +246,14 @@ class BuildDetailsAPIView(APIView):
             'testChanges': self.serialize(changed_tests, extended_serializers),
         })
 
-        return self.respond(context)
+        # only the immutable portion of the response gets cached
+        data = as_json(context)
+        if cache_key is not None:
+            redis.set(cache_key, data, ex=self.cache_expire)
+
+        context = json.loads(data)
+        context.update(self.get_mutable_context(build_id))
+        return self.respond(context, serialize=False)
 
     def get_stream_channels(self, build_id):
         return [
@@ -1,6 +1,6 @@
 from __future__ import absolute_import
 
-from sqlalchemy.orm import joinedload, subqueryload_all
+from sqlalchemy.orm import joinedload, subqueryload
 
 from changes.api.base import APIView
 from changes.models import Job, JobPhase, JobStep
@@ -9,15 +9,14 @@ from changes.models import Job, JobPhase, JobStep
 class JobPhaseIndexAPIView(APIView):
     def get(self, job_id):
         job = Job.query.options(
-            subqueryload_all(Job.phases),
             joinedload('project', innerjoin=True),
         ).get(job_id)
         if job is None:
             return '', 404
 
         phase_list = list(JobPhase.query.options(
-            subqueryload_all(JobPhase.steps, JobStep.node),
-            subqueryload_all(JobPhase.steps, JobStep.logsources)
+            subqueryload(JobPhase.steps).joinedload(JobStep.node),
+            subqueryload(JobPhase.steps).subqueryload(JobStep.logsources),
         ).filter(
             JobPhase.job_id == job.id,
         ).order_by(JobPhase.date_started.asc(), JobPhase.date_created.asc()))
@@ -1,5 +1,7 @@
 from __future__ import absolute_import
 
+import uuid
+
 from changes.buildsteps.base import BuildStep
 from changes.config import db
 from changes.constants import Status
@@ -11,6 +13,7 @@ from changes.models import Command as CommandModel, JobPhase, JobStep
 class Command(object):
     def __init__(self, script, path='', artifacts=None, env=None):
         self.script = script
+        self.label = script.splitlines()[0][:128] if script else ''
         self.path = path
         self.artifacts = artifacts or ()
         self.env = env or {}
@@ -26,17 +29,12 @@ class DefaultBuildStep(BuildStep):
     within a given timeout. All results are expected to be pushed via APIs.
     """
     def __init__(self, commands, path='', env=None, artifacts=None, **kwargs):
-        command_defaults = (
-            ('path', path),
-            ('env', env),
-            ('artifacts', artifacts),
-        )
         for command in commands:
-            for k, v in command_defaults:
-                if k not in command:
-                    command[k] = v
+            command.setdefault('path', path)
+            command.setdefault('env', env)
+            command.setdefault('artifacts', artifacts)
 
-        self.commands = map(lambda x: Command(**x), commands)
+        self.commands = [Command(**x) for x in commands]
 
         super(DefaultBuildStep, self).__init__(**kwargs)
 
@@ -64,18 +62,31 @@ class DefaultBuildStep(BuildStep):
             'project': phase.project,
         })
 
-        for index, command in enumerate(self.commands):
-            command_model, created = get_or_create(CommandModel, where={
-                'jobstep': step,
+        # one SELECT for whatever already exists and a single multi-row
+        # INSERT for the gap, rather than a get_or_create per command
+        existing_commands = set(order for order, in db.session.query(
+            CommandModel.order,
+        ).filter(
+            CommandModel.jobstep_id == step.id,
+        ))
+
+        to_create = [
+            {
+                'id': uuid.uuid4(),
+                'jobstep_id': step.id,
                 'order': index,
-            }, defaults={
-                'label': command.script.splitlines()[0][:128],
+                'label': command.label,
                 'status': Status.queued,
                 'script': command.script,
                 'env': command.env,
                 'cwd': command.path,
                 'artifacts': command.artifacts,
-            })
+            }
+            for index, command in enumerate(self.commands)
+            if index not in existing_commands
+        ]
+        if to_create:
+            db.session.execute(CommandModel.__table__.insert(), to_create)
         db.session.commit()
 
         sync_job_step.delay(
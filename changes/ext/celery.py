@@ -47,6 +47,29 @@ class _Celery(object):
                 )
         return task_id
 
+    def delay_many(self, tasks, **fn_kwargs):
+        """
+        Fire a batch of tasks, reusing a single producer (and thus a single
+        broker connection) for the whole batch rather than acquiring one per
+        task. Any extra keyword arguments (e.g. ``countdown``) are applied to
+        every publish in the batch.
+
+        >>> queue.delay_many([('sync_job', {'job_id': job.id.hex})])
+        """
+        celery = self.celery
+        if celery.conf.CELERY_ALWAYS_EAGER:
+            for name, kwargs in tasks:
+                self.delay(name, kwargs=kwargs, **fn_kwargs)
+            return
+        with celery.producer_or_acquire() as P:
+            for name, kwargs in tasks:
+                self.logger.debug('Firing task %r kwargs=%r', name, kwargs)
+                P.publish_task(
+                    task_name=name,
+                    task_kwargs=kwargs,
+                    **fn_kwargs
+                )
+
     def retry(self, name, *args, **kwargs):
         # unlike delay, we actually want to rely on Celery's retry logic
         # and because we can only execute this within a task, it's safe
@@ -72,6 +72,6 @@ class Build(db.Model):
         if self.date_modified is None:
             self.date_modified = self.date_created
         if self.date_started and self.date_finished and not self.duration:
-            self.duration = (self.date_finished - self.date_started).total_seconds() * 1000
+            self.duration = int((self.date_finished - self.date_started).total_seconds() * 1000)
         if self.number is None and self.project:
             self.number = select([func.next_item_value(self.project.id.hex)])
@@ -52,7 +52,7 @@ class BuildPhase(db.Model):
         if self.result is None:
             self.result = Result.unknown
         if self.status is None:
-            self.status = Result.unknown
+            self.status = Status.unknown
         if self.date_created is None:
             self.date_created = datetime.utcnow()
         if self.date_started and self.date_finished and not self.duration:
@@ -39,7 +39,7 @@ class JobPhase(db.Model):
         if self.result is None:
             self.result = Result.unknown
         if self.status is None:
-            self.status = Result.unknown
+            self.status = Status.unknown
         if self.date_created is None:
             self.date_created = datetime.utcnow()
 
@@ -4,12 +4,13 @@ import logging
 
 from datetime import datetime, timedelta
 from functools import wraps
-from threading import local, Lock
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql import case
 from uuid import uuid4
 
 from changes.config import db, queue
 from changes.constants import Result, Status
-from changes.db.utils import get_or_create
+from changes.db.utils import get_or_create, try_create
 from changes.models import Task
 from changes.utils.locking import lock
 
@@ -32,7 +33,7 @@ class TooManyRetries(Exception):
     pass
 
 
-class TrackedTask(local):
+class TrackedTask(object):
     """
     Tracks the state of the given Task and it's children.
 
@@ -59,7 +60,6 @@ class TrackedTask(local):
         self.task_name = func.__name__
         self.parent_id = None
         self.task_id = None
-        self.lock = Lock()
         self.logger = logging.getLogger('jobs.{0}'.format(self.task_name))
 
         self.max_retries = max_retries
@@ -71,8 +71,7 @@ class TrackedTask(local):
         self.__code__ = getattr(func, '__code__', None)
 
     def __call__(self, **kwargs):
-        with self.lock:
-            self._run(kwargs)
+        self._run(kwargs)
 
     def __repr__(self):
         return '<%s: task_name=%s>' % (type(self), self.task_name)
@@ -141,8 +140,10 @@ class TrackedTask(local):
 
             db.session.commit()
         finally:
-            db.session.expire_all()
-
+            # no need to expire_all() here: every path above ends in a
+            # commit or rollback, either of which already invalidates
+            # loaded state, and a blanket expire forces a re-SELECT for
+            # anything touched afterwards in the same process
             self.task_id = None
             self.parent_id = None
             self.kwargs = kwargs
@@ -155,11 +156,15 @@ class TrackedTask(local):
         """
         assert self.task_id
 
-        Task.query.filter(
+        # use a Core update to skip the ORM bookkeeping on this hot path;
+        # there's nothing in the session worth synchronizing here
+        db.session.execute(Task.__table__.update().where(
             Task.task_name == self.task_name,
+        ).where(
             Task.task_id == self.task_id,
+        ).where(
             Task.parent_id == self.parent_id,
-        ).update(kwargs, synchronize_session=False)
+        ).values(kwargs))
 
     def _continue(self, kwargs):
         kwargs['task_id'] = self.task_id
@@ -276,29 +281,45 @@ class TrackedTask(local):
             if k not in ('task_id', 'parent_task_id')
         )
 
-        task, created = get_or_create(Task, where={
-            'task_name': self.task_name,
-            'task_id': kwargs['task_id'],
-        }, defaults={
-            'parent_id': kwargs.get('parent_task_id'),
-            'data': {
-                'kwargs': fn_kwargs,
-            },
-            'status': Status.queued,
-        })
+        # the common case is that the task exists and has checked in
+        # recently, so look it up with a narrow SELECT and bail out early
+        # before doing any writes
+        task = Task.query.options(load_only(
+            'num_retries', 'date_created', 'date_modified',
+        )).filter_by(
+            task_name=self.task_name,
+            task_id=kwargs['task_id'],
+        ).limit(1).first()
 
-        if created or self.needs_requeued(task):
-            if not created:
-                task.date_modified = datetime.utcnow()
-                db.session.add(task)
+        if task is not None:
+            if not self.needs_requeued(task):
+                return
 
+            task.date_modified = datetime.utcnow()
+            db.session.add(task)
+            db.session.commit()
+        else:
+            task = try_create(Task, where={
+                'task_name': self.task_name,
+                'task_id': kwargs['task_id'],
+            }, defaults={
+                'parent_id': kwargs.get('parent_task_id'),
+                'data': {
+                    'kwargs': fn_kwargs,
+                },
+                'status': Status.queued,
+            })
+            if task is None:
+                # we lost the race against another delay_if_needed, which
+                # will have handled the enqueue itself
+                return
             db.session.commit()
 
-            queue.delay(
-                self.task_name,
-                kwargs=kwargs,
-                countdown=CONTINUE_COUNTDOWN,
-            )
+        queue.delay(
+            self.task_name,
+            kwargs=kwargs,
+            countdown=CONTINUE_COUNTDOWN,
+        )
 
     def delay(self, **kwargs):
         """
@@ -340,7 +361,12 @@ class TrackedTask(local):
         )
 
     def verify_all_children(self):
-        task_list = list(Task.query.filter(
+        # result and the start/finish dates are never read here, so leave
+        # them deferred
+        task_list = list(Task.query.options(load_only(
+            'task_name', 'task_id', 'parent_id', 'num_retries',
+            'date_created', 'date_modified', 'data',
+        )).filter(
             Task.parent_id == self.task_id,
             Task.status != Status.finished,
         ))
@@ -350,44 +376,56 @@ class TrackedTask(local):
 
         current_datetime = datetime.utcnow()
 
+        # track primary keys rather than instances so the sets can be handed
+        # to in_() directly
         need_expire = set()
         need_run = set()
 
         has_pending = False
 
+        to_delay = []
+
         for task in task_list:
             if self.needs_expired(task):
-                need_expire.add(task)
+                need_expire.add(task.id)
                 continue
 
             has_pending = True
 
             if self.needs_requeued(task) and 'kwargs' in task.data:
-                need_run.add(task)
-
-        if need_expire:
-            Task.query.filter(
-                Task.id.in_([n.id for n in need_expire]),
-            ).update({
-                Task.date_modified: current_datetime,
-                Task.date_finished: current_datetime,
-                Task.status: Status.finished,
-                Task.result: Result.aborted,
-            }, synchronize_session=False)
-            db.session.commit()
-
-        if need_run:
-            for task in need_run:
+                need_run.add(task.id)
                 child_kwargs = task.data['kwargs'].copy()
                 child_kwargs['parent_task_id'] = task.parent_id.hex
                 child_kwargs['task_id'] = task.task_id.hex
-                queue.delay(task.task_name, kwargs=child_kwargs)
+                to_delay.append((task.task_name, child_kwargs))
 
-            Task.query.filter(
-                Task.id.in_([n.id for n in need_run]),
-            ).update({
+        if to_delay:
+            # fire the entire batch over a single broker connection
+            queue.delay_many(to_delay)
+
+        if need_expire or need_run:
+            # both groups get their check-in bumped; the expired ones are
+            # additionally finished off, all in a single UPDATE
+            values = {
                 Task.date_modified: current_datetime,
-            }, synchronize_session=False)
+            }
+            if need_expire:
+                is_expired = Task.id.in_(need_expire)
+                values.update({
+                    Task.date_finished: case(
+                        [(is_expired, current_datetime)],
+                        else_=Task.date_finished),
+                    Task.status: case(
+                        [(is_expired, Status.finished.value)],
+                        else_=Task.status),
+                    Task.result: case(
+                        [(is_expired, Result.aborted.value)],
+                        else_=Task.result),
+                })
+
+            db.session.execute(Task.__table__.update().where(
+                Task.id.in_(need_expire | need_run),
+            ).values(values))
             db.session.commit()
 
         if has_pending:
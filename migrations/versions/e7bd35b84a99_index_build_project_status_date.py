@@ -0,0 +1,21 @@
+"""Index Build.project_id,status,date_created
+
+Revision ID: e7bd35b84a99
+Revises: 19168fe64c41
+Create Date: 2014-07-02 11:21:47.432902
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = 'e7bd35b84a99'
+down_revision = '19168fe64c41'
+
+from alembic import op
+
+
+def upgrade():
+    op.create_index('idx_build_project_status_date', 'build', ['project_id', 'status', 'date_created'])
+
+
+def downgrade():
+    op.drop_index('idx_build_project_status_date', 'build')
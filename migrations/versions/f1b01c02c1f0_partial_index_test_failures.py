@@ -0,0 +1,26 @@
+"""Partial index on failed tests
+
+Revision ID: f1b01c02c1f0
+Revises: e7bd35b84a99
+Create Date: 2014-07-02 14:08:31.745218
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = 'f1b01c02c1f0'
+down_revision = 'e7bd35b84a99'
+
+from alembic import op
+
+
+def upgrade():
+    # partial index for the test failure lists on build/job details; 2 is
+    # Result.failed
+    op.execute(
+        'CREATE INDEX idx_test_job_failures ON test (job_id, name) '
+        'WHERE result = 2'
+    )
+
+
+def downgrade():
+    op.drop_index('idx_test_job_failures', 'test')
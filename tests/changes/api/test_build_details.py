@@ -1,8 +1,8 @@
 from datetime import datetime
 
 from changes.config import db
-from changes.constants import Status
-from changes.models import Event, FailureReason, ItemStat, TestCase
+from changes.constants import Result, Status
+from changes.models import BuildSeen, Event, FailureReason, ItemStat, TestCase
 from changes.testutils import APITestCase, TestCase as BaseTestCase
 from changes.api.build_details import find_changed_tests
 
@@ -108,3 +108,62 @@ class BuildDetailsTest(APITestCase):
             ),
             'count': 1,
         }
+
+
+class BuildDetailsCacheTest(APITestCase):
+    def test_finished_build_is_cached(self):
+        project = self.create_project()
+        build = self.create_build(
+            project, status=Status.finished, result=Result.passed,
+            date_created=datetime(2013, 9, 19, 22, 15, 24),
+            date_finished=datetime(2013, 9, 19, 22, 19, 24))
+
+        path = '/api/0/builds/{0}/'.format(build.id.hex)
+
+        resp = self.client.get(path)
+        assert resp.status_code == 200
+        data = self.unserialize(resp)
+        assert data['name'] == 'Sample'
+        assert data['seenBy'] == []
+        assert data['events'] == []
+
+        # the immutable portion must now come from the cache, while
+        # seenBy/events are fetched fresh on every request
+        build.label = 'Changed'
+        db.session.add(build)
+        user = self.create_user(email='foo@example.com')
+        db.session.add(BuildSeen(build_id=build.id, user_id=user.id))
+        db.session.add(Event(
+            item_id=build.id,
+            type='green_build_notification',
+        ))
+        db.session.commit()
+
+        resp = self.client.get(path)
+        assert resp.status_code == 200
+        data = self.unserialize(resp)
+        assert data['name'] == 'Sample'
+        assert [u['id'] for u in data['seenBy']] == [user.id.hex]
+        assert len(data['events']) == 1
+
+    def test_unfinished_build_is_not_cached(self):
+        project = self.create_project()
+        build = self.create_build(
+            project, status=Status.in_progress,
+            date_created=datetime(2013, 9, 19, 22, 15, 24))
+
+        path = '/api/0/builds/{0}/'.format(build.id.hex)
+
+        resp = self.client.get(path)
+        assert resp.status_code == 200
+        data = self.unserialize(resp)
+        assert data['name'] == 'Sample'
+
+        build.label = 'Changed'
+        db.session.add(build)
+        db.session.commit()
+
+        resp = self.client.get(path)
+        assert resp.status_code == 200
+        data = self.unserialize(resp)
+        assert data['name'] == 'Changed'
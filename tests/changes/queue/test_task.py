@@ -172,8 +172,8 @@ class VerifyAllChildrenTest(TestCase):
         assert result == Status.finished
 
     @mock.patch('changes.queue.task.TrackedTask.needs_requeued')
-    @mock.patch('changes.config.queue.delay')
-    def test_child_needs_run(self, queue_delay, needs_requeued):
+    @mock.patch('changes.config.queue.delay_many')
+    def test_child_needs_run(self, queue_delay_many, needs_requeued):
         child_id = UUID('33846695b2774b29a71795a009e8168a')
         parent_task_id = UUID('659974858dcf4aa08e73a940e1066328')
 
@@ -196,13 +196,13 @@ class VerifyAllChildrenTest(TestCase):
         assert result == Status.in_progress
 
         needs_requeued.assert_called_once_with(task)
-        queue_delay.assert_called_once_with(
-            'success_task', kwargs={
+        queue_delay_many.assert_called_once_with([
+            ('success_task', {
                 'task_id': child_id.hex,
                 'parent_task_id': parent_task_id.hex,
                 'foo': 'bar',
-            },
-        )
+            }),
+        ])
 
     @mock.patch('changes.queue.task.TrackedTask.needs_expired')
     @mock.patch('changes.config.queue.delay')